@@ -7,21 +7,438 @@ Interactive CLI for generating synthetic person data and managing the Earth data
 
 import sys
 import os
+import argparse
+import importlib.util
+import json
+import queue
+import secrets
+import threading
+import time
+from collections import deque
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+)
+
+try:
+    import termios
+    import tty
+except ImportError:  # Windows
+    termios = None
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Fall back to the source tree only when the earth package isn't installed,
+# so an installed copy is never shadowed
+if importlib.util.find_spec("loader") is None:
+    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-import pandas as pd
 from loader import (
     DatabaseConfig,
-    connect_to_duckdb,
+    get_connection,
+    close_connections,
     operate_on_table,
     get_table_info,
     log,
 )
-from generators.person import generate_multiple_persons
+
+# Number of generated batches allowed to wait for the database writer
+PREFETCH_DEPTH = 2
+
+# Record count above which generation is spread across worker processes,
+# and the most worker processes a run will start
+PARALLEL_THRESHOLD = 10000
+MAX_WORKERS = 8
+
+# Memory budget for all batches alive at once, and the rough in-memory size
+# (about 3 KB) of one generated profile including its column copy
+BATCH_MEMORY_BUDGET = 256 * 1024 * 1024
+APPROX_PROFILE_BYTES = 3 * 1024
+
+# Most batches alive at once: queued for the writer, being written, and two
+# in flight per worker process
+MAX_BATCHES_HELD = PREFETCH_DEPTH + 1 + 2 * MAX_WORKERS
+
+# Fields of a generation ledger's first line, which describes the whole run
+LEDGER_HEADER_KEYS = ("target", "how", "seed", "batch_size")
+
+# Smallest batch worth a database round trip
+MIN_BATCH_SIZE = 1000
+
+# Columns and row count of the sample shown after generating
+SAMPLE_COLUMNS = ("person_id", "full_name", "age", "city", "job_title")
+SAMPLE_SIZE = 5
+
+# Minimum seconds between progress line redraws
+PROGRESS_INTERVAL = 0.1
+
+# Progress lines written per run when output is not a terminal
+PROGRESS_LINES = 20
+
+# Static menu text, rendered once rather than on every prompt
+BANNER = "\n".join(["", "=" * 60, "🌍 EARTH - Synthetic Data Generator", "=" * 60])
+DATA_MANAGEMENT_MENU = "\n".join(
+    [
+        "",
+        "🔄 Data Management Options:",
+        "   1. Append new records to existing data",
+        "   2. Replace all existing data with new records",
+    ]
+)
+DATA_MANAGEMENT_CHOICES = {"1": "append", "2": "truncate"}
+
+# Multi-line reports, filled in with str.format_map and printed in one call
+DATABASE_STATUS_TEMPLATE = "\n".join(
+    [
+        "",
+        "📊 Current database status:",
+        "   • Table: {table}",
+        "   • Existing records: {row_count:,}",
+        "   • Columns: {column_count}",
+        DATA_MANAGEMENT_MENU,
+    ]
+)
+GENERATION_COMPLETE_TEMPLATE = "\n".join(
+    [
+        "",
+        "✅ Generation complete!",
+        "   • Total records in database: {total:,}",
+        "   • Records added this session: {added:,}",
+        "   • Database file: earth.duckdb",
+    ]
+)
+
+# Age range, gender split and top cities in a single pass over the table.
+# GROUPING() tells the three grouping sets apart: 7 is the grand total,
+# 3 is per gender and 4 is per city.
+STATS_QUERY = """
+WITH grouped AS MATERIALIZED (
+    SELECT
+        GROUPING(gender, city, state) AS grouping_set,
+        gender,
+        city,
+        state,
+        COUNT(*) AS count,
+        MIN(age) AS min_age,
+        MAX(age) AS max_age,
+        AVG(age) AS avg_age
+    FROM {table}
+    GROUP BY GROUPING SETS ((), (gender), (city, state))
+)
+SELECT
+    total.count,
+    total.min_age,
+    total.max_age,
+    total.avg_age,
+    (
+        SELECT list({{'gender': gender, 'count': count}} ORDER BY count DESC)
+        FROM grouped
+        WHERE grouping_set = 3
+    ) AS genders,
+    (
+        SELECT list({{'city': city, 'state': state, 'count': count}} ORDER BY count DESC)
+        FROM (
+            SELECT * FROM grouped WHERE grouping_set = 4 ORDER BY count DESC LIMIT 5
+        )
+    ) AS top_cities
+FROM grouped AS total
+WHERE total.grouping_set = 7
+"""
+
+
+# Answers read from non-interactive stdin, loaded in full on first prompt
+_scripted_answers: Optional[Deque[str]] = None
+
+
+def ask(prompt: str) -> str:
+    """
+    Read one line of input.
+
+    When stdin is a pipe or file, it is read in a single call on first use
+    and later prompts are answered from memory instead of blocking in
+    input() once per line.
+
+    Args:
+        prompt: Text shown before reading
+
+    Returns:
+        The line entered, without its newline
+
+    Raises:
+        EOFError: If no input is left
+    """
+    global _scripted_answers
+
+    if sys.stdin.isatty():
+        return input(prompt)
+
+    if _scripted_answers is None:
+        _scripted_answers = deque(sys.stdin.read().splitlines())
+
+    print(prompt, end="")
+    if not _scripted_answers:
+        print()
+        raise EOFError("no input left for prompt")
+    answer = _scripted_answers.popleft()
+    print(answer)
+    return answer
+
+
+def read_key(prompt: str) -> str:
+    """
+    Read a single keypress without waiting for Enter.
+
+    The terminal is put in cbreak mode only for the read, so Ctrl+C still
+    interrupts as usual.
+
+    Falls back to a line read when stdin isn't a terminal (pipes, tests)
+    or the platform has no termios.
+
+    Args:
+        prompt: Text shown before reading
+
+    Returns:
+        The key pressed, or the stripped line entered
+    """
+    if termios is None or not sys.stdin.isatty():
+        return ask(prompt).strip()
+
+    print(prompt, end="", flush=True)
+    fd = sys.stdin.fileno()
+    saved = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        key = sys.stdin.read(1)
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+    print(key)
+    return key
+
+
+def choose_batch_size(count: int) -> int:
+    """
+    Pick a batch size from the memory budget rather than a fixed row count.
+
+    Larger batches mean fewer database writes and ledger updates, but every
+    batch that can be alive at once counts against BATCH_MEMORY_BUDGET. The
+    size never depends on how many worker processes run, so a seeded run
+    writes the same records on any machine.
+
+    Args:
+        count: Total number of records to generate
+
+    Returns:
+        Records per batch
+    """
+    by_memory = BATCH_MEMORY_BUDGET // (APPROX_PROFILE_BYTES * MAX_BATCHES_HELD)
+    return max(1, min(count, max(MIN_BATCH_SIZE, by_memory)))
+
+
+def format_rows(columns: Iterable[str], rows: Iterable[Iterable[Any]]) -> str:
+    """
+    Render rows as a right-aligned fixed-width table with a header line.
+
+    Args:
+        columns: Column headers
+        rows: Row values, one iterable per row
+
+    Returns:
+        The table as a single string
+    """
+    cells = [list(columns)] + [[str(value) for value in row] for row in rows]
+    widths = [max(map(len, column)) for column in zip(*cells)]
+    return "\n".join(
+        " ".join(cell.rjust(width) for cell, width in zip(row, widths)) for row in cells
+    )
+
+
+class ProgressLine:
+    """
+    Single-line progress display that redraws at most every `interval` seconds.
+
+    On a terminal the line is rewritten in place with a carriage return;
+    otherwise each redraw is written as its own line, so redraws are spaced
+    by progress instead, giving at most about PROGRESS_LINES lines per run.
+    """
+
+    def __init__(self, total: int, interval: float = PROGRESS_INTERVAL):
+        self.total = total
+        self.interval = interval
+        self.stream = sys.stdout
+        self.in_place = self.stream.isatty()
+        self._last_draw = float("-inf")
+        self._step = max(1, total // PROGRESS_LINES)
+        self._next_line = 0
+        self._open = False
+
+    def update(self, done: int, batch_num: int, batches: int) -> None:
+        """Redraw the line if enough time or progress has passed, or at the end."""
+        if done < self.total:
+            if not self.in_place:
+                if done < self._next_line:
+                    return
+                self._next_line = done + self._step
+            else:
+                now = time.monotonic()
+                if now - self._last_draw < self.interval:
+                    return
+                self._last_draw = now
+
+        line = (
+            f"   Batch {batch_num}/{batches}: "
+            f"{done / self.total * 100:.1f}% ({done:,}/{self.total:,})"
+        )
+        if self.in_place:
+            self.stream.write(f"\r{line}")
+            self._open = True
+        else:
+            self.stream.write(f"{line}\n")
+        self.stream.flush()
+
+        if done >= self.total:
+            self.close()
+
+    def close(self) -> None:
+        """End an in-place line so following output starts on a fresh line."""
+        if self._open:
+            self.stream.write("\n")
+            self.stream.flush()
+            self._open = False
+
+
+class _ProducerFailed:
+    """Carries an exception raised on the producer thread to the consumer."""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+_PRODUCER_DONE = object()
+
+
+def prefetch(batches: Iterable[Any], depth: int = PREFETCH_DEPTH) -> Iterator[Any]:
+    """
+    Produce batches on a background thread while the caller consumes them.
+
+    Generation is pure Python while DuckDB inserts run in C and release the
+    GIL, so the two overlap instead of alternating. The bounded queue applies
+    backpressure, keeping at most `depth` batches waiting in memory.
+
+    Args:
+        batches: Iterable of batches to produce
+        depth: Maximum number of batches buffered ahead of the consumer
+
+    Yields:
+        Batches in the order produced
+    """
+    buffer: "queue.Queue[Any]" = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(item: Any) -> bool:
+        # Poll so the producer notices when the consumer has gone away
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for batch in batches:
+                if not put(batch):
+                    return
+            put(_PRODUCER_DONE)
+        except BaseException as e:
+            put(_ProducerFailed(e))
+
+    producer = threading.Thread(target=produce, name="earth-producer", daemon=True)
+    producer.start()
+
+    try:
+        while True:
+            item = buffer.get()
+            if item is _PRODUCER_DONE:
+                return
+            if isinstance(item, _ProducerFailed):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+
+class GenerationLedger:
+    """
+    Append-only JSONL record of the batches stored by a generation run.
+
+    The first line describes the run and each following line is appended
+    (and fsynced) after a batch has been written to the database. A ledger
+    that still exists at startup therefore belongs to an interrupted run.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def start(self, target: int, how: str, seed: int, batch_size: int) -> None:
+        """Begin a new run, discarding any previous ledger."""
+        self._write(
+            {"target": target, "how": how, "seed": seed, "batch_size": batch_size},
+            mode="w",
+        )
+
+    def record(self, rows: int) -> None:
+        """Record a batch that has been stored."""
+        self._write({"rows": rows}, mode="a")
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        Read the ledger of an interrupted run.
+
+        Returns:
+            Dict with the run's target, how, seed and batch_size, plus the
+            batches and rows stored so far, or None if no run is pending
+        """
+        if not self.path.exists():
+            return None
+
+        entries = []
+        with self.path.open() as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A torn final line from a crash mid-write
+                    continue
+
+        # Without its seed and batch size a run can't be replayed exactly
+        if not entries or not all(key in entries[0] for key in LEDGER_HEADER_KEYS):
+            return None
+
+        header, stored = entries[0], entries[1:]
+        return {
+            **{key: header[key] for key in LEDGER_HEADER_KEYS},
+            "batches": len(stored),
+            "written": sum(entry.get("rows", 0) for entry in stored),
+        }
+
+    def clear(self) -> None:
+        """Remove the ledger once a run has completed."""
+        if self.path.exists():
+            self.path.unlink()
+
+    def _write(self, entry: Dict[str, Any], mode: str) -> None:
+        with self.path.open(mode) as f:
+            f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
 
 
 class EarthCLI:
@@ -31,11 +448,15 @@ class EarthCLI:
         self.conn = None
         self.schema_name = "raw"
         self.table_name = "persons"
+        self.db_config = DatabaseConfig.for_dev()
+        self.ledger = GenerationLedger(
+            self.db_config.db_path.parent / f"{self.table_name}.ledger.jsonl"
+        )
 
     def initialize_database(self) -> None:
         """Initialize database connection and ensure schema exists."""
         try:
-            self.conn = connect_to_duckdb(DatabaseConfig.for_dev())
+            self.conn = get_connection(self.db_config)
             log("Database connection established successfully")
         except Exception as e:
             log(f"Failed to initialize database: {e}", "error")
@@ -48,27 +469,26 @@ class EarthCLI:
         Returns:
             Tuple of (record_count, action_choice)
         """
-        print("\n" + "=" * 60)
-        print("🌍 EARTH - Synthetic Data Generator")
-        print("=" * 60)
+        print(BANNER)
 
         # Check existing data
         table_info = get_table_info(self.conn, self.schema_name, self.table_name)
 
         if table_info["exists"] and table_info["row_count"] > 0:
-            print(f"\n📊 Current database status:")
-            print(f"   • Table: {self.schema_name}.{self.table_name}")
-            print(f"   • Existing records: {table_info['row_count']:,}")
-            print(f"   • Columns: {len(table_info['columns'])}")
-
-            print("\n🔄 Data Management Options:")
-            print("   1. Append new records to existing data")
-            print("   2. Replace all existing data with new records")
+            print(
+                DATABASE_STATUS_TEMPLATE.format_map(
+                    {
+                        "table": f"{self.schema_name}.{self.table_name}",
+                        "row_count": table_info["row_count"],
+                        "column_count": len(table_info["columns"]),
+                    }
+                )
+            )
 
             while True:
-                choice = input("\nSelect option (1 or 2): ").strip()
-                if choice in ["1", "2"]:
-                    action_choice = "append" if choice == "1" else "truncate"
+                choice = read_key("\nSelect option (1 or 2): ")
+                if choice in DATA_MANAGEMENT_CHOICES:
+                    action_choice = DATA_MANAGEMENT_CHOICES[choice]
                     break
                 print("❌ Please enter 1 or 2")
         else:
@@ -77,59 +497,178 @@ class EarthCLI:
 
         # Get number of records to generate
         while True:
-            try:
-                count_input = input(
-                    "\n📈 How many person records to generate? "
-                ).strip()
-                record_count = int(count_input)
-                if record_count <= 0:
-                    print("❌ Please enter a positive number")
-                    continue
-                if record_count > 100000:
-                    confirm = (
-                        input(
-                            f"⚠️  Generating {record_count:,} records may take time. Continue? (y/N): "
-                        )
-                        .strip()
-                        .lower()
-                    )
-                    if confirm not in ["y", "yes"]:
-                        continue
-                break
-            except ValueError:
+            count_input = ask("\n📈 How many person records to generate? ").strip()
+
+            # Check the text up front rather than catching int()'s ValueError
+            digits = count_input[1:] if count_input[:1] in ("+", "-") else count_input
+            if not digits.isdecimal():
                 print("❌ Please enter a valid number")
+                continue
+
+            record_count = int(count_input)
+            if record_count <= 0:
+                print("❌ Please enter a positive number")
+                continue
+            if record_count > 100000:
+                confirm = (
+                    ask(
+                        f"⚠️  Generating {record_count:,} records may take time. Continue? (y/N): "
+                    )
+                    .strip()
+                    .lower()
+                )
+                if confirm not in ["y", "yes"]:
+                    continue
+            break
 
         return record_count, action_choice
 
-    def generate_and_store_data(self, count: int, how: str) -> None:
+    def pending_run(self) -> Optional[Dict[str, Any]]:
+        """
+        Load the ledger of an interrupted run.
+
+        A ledger whose rows all landed belongs to a run that stopped just
+        before removing it, so it is removed here instead.
+
+        Returns:
+            The ledger contents, or None if no run is pending
+        """
+        pending = self.ledger.load()
+        if pending is not None and pending["written"] >= pending["target"]:
+            self.ledger.clear()
+            return None
+        return pending
+
+    def check_interrupted_run(self) -> Optional[Dict[str, Any]]:
+        """
+        Offer to finish a generation run that was interrupted.
+
+        Returns:
+            The interrupted run's ledger contents to resume, or None
+        """
+        pending = self.pending_run()
+        if pending is None:
+            return None
+
+        print(
+            f"\n⚠️  Previous run was interrupted after "
+            f"{pending['written']:,} of {pending['target']:,} records"
+        )
+        choice = ask("Resume and generate the remaining records? (Y/n): ")
+        if choice.strip().lower() not in ["", "y", "yes"]:
+            self.ledger.clear()
+            return None
+
+        return pending
+
+    def check_discard_interrupted_run(self, replace: bool) -> None:
+        """
+        Keep a new run from silently discarding an interrupted one.
+
+        The ledger of an unfinished run is only dropped when its data is being
+        replaced anyway; otherwise exit, pointing at how to resume instead.
+
+        Args:
+            replace: Whether the new run replaces existing data
+        """
+        pending = self.pending_run()
+        if pending is None:
+            return
+
+        progress = f"{pending['written']:,} of {pending['target']:,} records"
+        if not replace:
+            print(f"❌ A previous run was interrupted after {progress}")
+            print("   Pass --resume to finish it, or --replace to discard it")
+            sys.exit(1)
+
+        log(f"Discarding interrupted run after {progress}", "warning")
+        print(f"⚠️  Discarding interrupted run after {progress}")
+
+    def resume_interrupted_run(self, pending: Dict[str, Any]) -> None:
+        """
+        Store the batches an interrupted run did not get to.
+
+        The run's seed and batch size come from its ledger, so the remaining
+        batches hold the same records the uninterrupted run would have stored.
+
+        Args:
+            pending: Ledger contents of the interrupted run
+        """
+        self.generate_and_store_data(
+            pending["target"],
+            pending["how"],
+            batch_size=pending["batch_size"],
+            seed=pending["seed"],
+            skip_batches=pending["batches"],
+        )
+
+    def generate_and_store_data(
+        self,
+        count: int,
+        how: str,
+        batch_size: Optional[int] = None,
+        seed: Optional[int] = None,
+        skip_batches: int = 0,
+    ) -> None:
         """
         Generate person data and store in database.
 
         Args:
-            count: Number of records to generate
-            how: Write method ('append' or 'truncate')
+            count: Number of records in the run
+            how: Write method for the run's first batch ('append' or 'truncate')
+            batch_size: Records per batch; sized from the memory budget if None
+            seed: Random seed for reproducible records; drawn at random if
+                None, so an interrupted run can still be resumed exactly
+            skip_batches: Leading batches already stored by an interrupted
+                attempt at this run
         """
-        print(f"\n🔄 Generating {count:,} person records...")
+        import pandas as pd
+        from generators.person import iter_person_batches, profiles_to_columns
 
-        try:
-            # Generate data in batches for better memory management
-            batch_size = min(1000, count)
-            batches = (count + batch_size - 1) // batch_size
+        # Generate data in batches for better memory management
+        if batch_size is None:
+            batch_size = choose_batch_size(count)
+        batch_size = min(batch_size, count)
+        batches = (count + batch_size - 1) // batch_size
 
-            total_generated = 0
+        # The ledger records the seed either way, so resuming replays this run
+        if seed is None:
+            seed = secrets.randbits(64)
 
-            for batch_num in range(batches):
-                current_batch_size = min(batch_size, count - total_generated)
+        # Only the last batch can be short, so skipped batches are all full
+        already_stored = skip_batches * batch_size
+        remaining = count - already_stored
 
-                print(
-                    f"   Batch {batch_num + 1}/{batches}: Generating {current_batch_size} records..."
-                )
+        print(f"\n🔄 Generating {remaining:,} person records...")
+
+        if not skip_batches:
+            self.ledger.start(count, how, seed, batch_size)
 
-                # Generate batch of person profiles
-                persons = generate_multiple_persons(current_batch_size)
+        progress = ProgressLine(count)
 
-                # Convert to DataFrame
-                df = pd.DataFrame([person.to_dict() for person in persons])
+        try:
+            workers = 1
+            if remaining >= PARALLEL_THRESHOLD:
+                workers = min(os.cpu_count() or 1, MAX_WORKERS)
+
+            total_generated = already_stored
+            recent: List[Any] = []
+
+            # Generate the next batch while the current one is being written
+            for batch_num, persons in enumerate(
+                prefetch(
+                    iter_person_batches(
+                        count,
+                        batch_size=batch_size,
+                        seed=seed,
+                        workers=workers,
+                        skip_batches=skip_batches,
+                    )
+                ),
+                start=skip_batches,
+            ):
+                # Convert to DataFrame column by column
+                df = pd.DataFrame(profiles_to_columns(persons))
 
                 # Determine write method for this batch
                 batch_how = how if batch_num == 0 else "append"
@@ -144,33 +683,30 @@ class EarthCLI:
                     how=batch_how,
                 )
 
-                total_generated += current_batch_size
+                self.ledger.record(len(persons))
+                total_generated += len(persons)
+                recent = (recent + persons[-SAMPLE_SIZE:])[-SAMPLE_SIZE:]
 
-                # Progress update
-                progress = (total_generated / count) * 100
-                print(f"   Progress: {progress:.1f}% ({total_generated:,}/{count:,})")
+                progress.update(total_generated, batch_num + 1, batches)
+
+            self.ledger.clear()
 
             # Final status
             final_info = get_table_info(self.conn, self.schema_name, self.table_name)
 
-            print(f"\n✅ Generation complete!")
-            print(f"   • Total records in database: {final_info['row_count']:,}")
-            print(f"   • Records added this session: {count:,}")
-            print(f"   • Database file: earth.duckdb")
-
-            # Show sample of generated data
-            sample_df = operate_on_table(
-                conn=self.conn,
-                schema_name=self.schema_name,
-                table_name=self.table_name,
-                action="read",
-                query=f"SELECT person_id, full_name, age, city, job_title FROM {self.schema_name}.{self.table_name} ORDER BY created_at DESC LIMIT 5",
+            print(
+                GENERATION_COMPLETE_TEMPLATE.format_map(
+                    {"total": final_info["row_count"], "added": remaining}
+                )
             )
 
+            # Show the newest records from memory rather than re-reading them
+            sample_row = attrgetter(*SAMPLE_COLUMNS)
             print(f"\n📋 Sample of generated data:")
-            print(sample_df.to_string(index=False))
+            print(format_rows(SAMPLE_COLUMNS, map(sample_row, reversed(recent))))
 
         except Exception as e:
+            progress.close()
             log(f"Error during data generation: {e}", "error")
             print(f"❌ Error during generation: {e}")
             sys.exit(1)
@@ -185,56 +721,34 @@ class EarthCLI:
                 print("\n📊 Database is empty - no person records found")
                 return
 
-            print(f"\n📊 Database Statistics:")
-            print(f"   • Total persons: {table_info['row_count']:,}")
+            # All statistics come from one scan of the table
+            total, min_age, max_age, avg_age, genders, top_cities = self.conn.execute(
+                STATS_QUERY.format(table=f"{self.schema_name}.{self.table_name}")
+            ).fetchone()
 
-            # Age distribution
-            age_stats = operate_on_table(
-                conn=self.conn,
-                schema_name=self.schema_name,
-                table_name=self.table_name,
-                action="read",
-                query=f"SELECT MIN(age) as min_age, MAX(age) as max_age, AVG(age) as avg_age FROM {self.schema_name}.{self.table_name}",
-            )
+            # Render the whole report first and write it in one call
+            lines = ["", "📊 Database Statistics:", f"   • Total persons: {total:,}"]
 
-            if not age_stats.empty:
-                print(
-                    f"   • Age range: {int(age_stats['min_age'].iloc[0])} - {int(age_stats['max_age'].iloc[0])} years"
-                )
-                print(f"   • Average age: {age_stats['avg_age'].iloc[0]:.1f} years")
-
-            # Gender distribution
-            gender_dist = operate_on_table(
-                conn=self.conn,
-                schema_name=self.schema_name,
-                table_name=self.table_name,
-                action="read",
-                query=f"SELECT gender, COUNT(*) as count FROM {self.schema_name}.{self.table_name} GROUP BY gender ORDER BY count DESC",
-            )
+            if min_age is not None:
+                lines.append(f"   • Age range: {min_age} - {max_age} years")
+                lines.append(f"   • Average age: {avg_age:.1f} years")
 
-            if not gender_dist.empty:
-                print(f"   • Gender distribution:")
-                for _, row in gender_dist.iterrows():
-                    percentage = (row["count"] / table_info["row_count"]) * 100
-                    print(
-                        f"     - {row['gender']}: {row['count']:,} ({percentage:.1f}%)"
-                    )
+            if genders:
+                lines.append("   • Gender distribution:")
+                lines.extend(
+                    f"     - {row['gender']}: {row['count']:,} "
+                    f"({row['count'] / total * 100:.1f}%)"
+                    for row in genders
+                )
 
-            # Top cities
-            top_cities = operate_on_table(
-                conn=self.conn,
-                schema_name=self.schema_name,
-                table_name=self.table_name,
-                action="read",
-                query=f"SELECT city, state, COUNT(*) as count FROM {self.schema_name}.{self.table_name} GROUP BY city, state ORDER BY count DESC LIMIT 5",
-            )
+            if top_cities:
+                lines.append("   • Top cities:")
+                lines.extend(
+                    f"     - {row['city']}, {row['state']}: {row['count']} persons"
+                    for row in top_cities
+                )
 
-            if not top_cities.empty:
-                print(f"   • Top cities:")
-                for _, row in top_cities.iterrows():
-                    print(
-                        f"     - {row['city']}, {row['state']}: {row['count']} persons"
-                    )
+            print("\n".join(lines))
 
         except Exception as e:
             log(f"Error displaying stats: {e}", "error")
@@ -247,40 +761,160 @@ class EarthCLI:
         # Initialize database
         self.initialize_database()
 
-        # Get user preferences
-        count, how = self.get_user_input()
-
-        # Confirm generation
-        action_text = (
-            "append to existing data" if how == "append" else "replace existing data"
-        )
-        print(f"\n🚀 Ready to generate {count:,} records and {action_text}")
-        confirm = input("Continue? (Y/n): ").strip().lower()
+        try:
+            # Finish an interrupted run first, otherwise ask for a new one
+            pending = self.check_interrupted_run()
+            if pending:
+                count = pending["target"] - pending["written"]
+                # Once a batch has landed, the truncate has already happened
+                how = "append" if pending["written"] else pending["how"]
+            else:
+                count, how = self.get_user_input()
+
+            # Confirm generation
+            action_text = (
+                "append to existing data"
+                if how == "append"
+                else "replace existing data"
+            )
+            print(f"\n🚀 Ready to generate {count:,} records and {action_text}")
+            confirm = ask("Continue? (Y/n): ").strip().lower()
+
+            if confirm in ["", "y", "yes"]:
+                # Generate and store data
+                if pending:
+                    self.resume_interrupted_run(pending)
+                else:
+                    self.generate_and_store_data(count, how)
+
+                # Display final statistics
+                self.display_database_stats()
+
+                print(f"\n🎉 Earth data generation complete!")
+                print(f"   Database location: {os.path.abspath('earth.duckdb')}")
+                print(f"   Logs location: {os.path.abspath('logs/loader/')}")
+            else:
+                print("❌ Generation cancelled by user")
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Close this CLI's cursor; the shared database handle stays open."""
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+            log("Database cursor closed")
 
-        if confirm in ["", "y", "yes"]:
-            # Generate and store data
-            self.generate_and_store_data(count, how)
 
-            # Display final statistics
-            self.display_database_stats()
+def cmd_generate(args: argparse.Namespace) -> None:
+    """Generate records, or finish an interrupted run, without prompting."""
+    cli = EarthCLI()
+    if args.resume:
+        pending = cli.pending_run()
+        if pending is None:
+            print("❌ No interrupted run to resume")
+            sys.exit(1)
+    else:
+        cli.check_discard_interrupted_run(args.replace)
 
-            print(f"\n🎉 Earth data generation complete!")
-            print(f"   Database location: {os.path.abspath('earth.duckdb')}")
-            print(f"   Logs location: {os.path.abspath('logs/loader/')}")
+    cli.initialize_database()
+    try:
+        if args.resume:
+            cli.resume_interrupted_run(pending)
         else:
-            print("❌ Generation cancelled by user")
+            how = "truncate" if args.replace else "append"
+            cli.generate_and_store_data(
+                args.count, how, batch_size=args.batch_size, seed=args.seed
+            )
+    finally:
+        cli.close()
 
-        # Close connection
-        if self.conn:
-            self.conn.close()
-            log("Database connection closed")
+
+def cmd_stats(args: argparse.Namespace) -> None:
+    """Print database statistics."""
+    cli = EarthCLI()
+    cli.initialize_database()
+    try:
+        cli.display_database_stats()
+    finally:
+        cli.close()
 
 
-def main() -> None:
+COMMANDS: Dict[str, Callable[[argparse.Namespace], None]] = {
+    "generate": cmd_generate,
+    "stats": cmd_stats,
+}
+
+
+def positive_int(value: str) -> int:
+    """Parse a command-line argument that must be a positive integer."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive number: {value}")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the parser for non-interactive subcommands."""
+    parser = argparse.ArgumentParser(
+        prog="earth",
+        description="Earth synthetic data generator. Run without arguments "
+        "for the interactive prompt.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    generate = subparsers.add_parser("generate", help="Generate person records")
+    target = generate.add_mutually_exclusive_group(required=True)
+    target.add_argument(
+        "count", nargs="?", type=positive_int, help="Number of records to generate"
+    )
+    target.add_argument(
+        "--resume",
+        action="store_true",
+        help="Finish an interrupted run with its recorded seed and batch size",
+    )
+    generate.add_argument(
+        "--replace",
+        action="store_true",
+        help="Replace existing data instead of appending",
+    )
+    generate.add_argument(
+        "--batch-size",
+        type=positive_int,
+        help="Records per batch (default: sized from available memory budget)",
+    )
+    generate.add_argument(
+        "--seed",
+        type=int,
+        help="Random seed; the same seed, count and batch size generate the same "
+        "people (person_id and created_at still differ)",
+    )
+
+    subparsers.add_parser("stats", help="Show database statistics")
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
     """Main entry point."""
+    argv = sys.argv[1:] if argv is None else argv
+
     try:
-        cli = EarthCLI()
-        cli.run()
+        if not argv:
+            # Interactive mode needs no parser at all
+            EarthCLI().run()
+            return
+
+        parser = build_parser()
+        args = parser.parse_args(argv)
+        if getattr(args, "resume", False) and (
+            args.replace or args.batch_size is not None or args.seed is not None
+        ):
+            parser.error("--resume reuses the interrupted run's own settings")
+        COMMANDS[args.command](args)
     except KeyboardInterrupt:
         print("\n\n❌ Generation interrupted by user")
         sys.exit(1)
@@ -288,6 +922,8 @@ def main() -> None:
         log(f"Unexpected error in main: {e}", "error")
         print(f"❌ Unexpected error: {e}")
         sys.exit(1)
+    finally:
+        close_connections()
 
 
 if __name__ == "__main__":
@@ -2,16 +2,43 @@
 Earth: Synthetic data generation platform for analytics engineering.
 """
 
+import importlib
+from typing import Any
+
 __version__ = "0.1.0"
 __author__ = "Chris Adan"
 
-from .loader import connect_to_duckdb, operate_on_table, log
-from .generators.person import generate_person, PersonProfile
+# Exported names mapped to the submodule that defines them. Resolved on first
+# access so importing the package doesn't pull in duckdb, pandas, and faker.
+_LAZY_EXPORTS = {
+    "connect_to_duckdb": ".loader",
+    "get_connection": ".loader",
+    "operate_on_table": ".loader",
+    "log": ".loader",
+    "generate_person": ".generators.person",
+    "PersonProfile": ".generators.person",
+}
 
 __all__ = [
     "connect_to_duckdb",
+    "get_connection",
     "operate_on_table",
     "log",
     "generate_person",
     "PersonProfile",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import exported names on demand (PEP 562)."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -9,8 +9,77 @@ from utils import (
     CAREER_TITLES,
     SALARY_RANGES,
     INDUSTRY_MULTIPLIERS,
+    draw_for_age,
+    expand_age_brackets,
 )
 import random
+from itertools import accumulate
+
+# Career level distribution by age bracket: (upper age bound, levels, weights).
+# The final bracket has no upper bound.
+CAREER_LEVEL_BRACKETS = (
+    # College age - entry level only
+    (22, (CareerLevel.CL_1,), (1.0,)),
+    # Early career - mostly entry, some associate
+    (25, (CareerLevel.CL_1, CareerLevel.CL_2), (0.8, 0.2)),
+    # Building experience
+    (30, (CareerLevel.CL_1, CareerLevel.CL_2, CareerLevel.CL_3), (0.2, 0.6, 0.2)),
+    # Establishing career
+    (35, (CareerLevel.CL_2, CareerLevel.CL_3, CareerLevel.CL_4), (0.2, 0.6, 0.2)),
+    # Mid-career progression
+    (40, (CareerLevel.CL_3, CareerLevel.CL_4, CareerLevel.CL_5), (0.3, 0.5, 0.2)),
+    # Senior roles emerging
+    (
+        45,
+        (CareerLevel.CL_3, CareerLevel.CL_4, CareerLevel.CL_5, CareerLevel.CL_6),
+        (0.2, 0.4, 0.3, 0.1),
+    ),
+    # Leadership roles
+    (
+        50,
+        (CareerLevel.CL_4, CareerLevel.CL_5, CareerLevel.CL_6, CareerLevel.CL_7),
+        (0.2, 0.4, 0.3, 0.1),
+    ),
+    # Peak career years
+    (
+        55,
+        (CareerLevel.CL_5, CareerLevel.CL_6, CareerLevel.CL_7, CareerLevel.CL_8),
+        (0.2, 0.4, 0.3, 0.1),
+    ),
+    # Senior leadership
+    (60, (CareerLevel.CL_6, CareerLevel.CL_7, CareerLevel.CL_8), (0.4, 0.4, 0.2)),
+    # Near retirement - mix of senior roles and some stepping down
+    (
+        None,
+        (CareerLevel.CL_5, CareerLevel.CL_6, CareerLevel.CL_7, CareerLevel.CL_8),
+        (0.2, 0.3, 0.3, 0.2),
+    ),
+)
+
+_CAREER_LEVEL_TABLE = expand_age_brackets(CAREER_LEVEL_BRACKETS)
+
+
+# Industry mix reflecting a realistic US job distribution
+INDUSTRIES = (
+    "tech",
+    "business",
+    "sales_marketing",
+    "healthcare",
+    "education",
+    "general",
+)
+INDUSTRY_WEIGHTS = (0.15, 0.20, 0.20, 0.15, 0.10, 0.20)
+_INDUSTRY_CUM_WEIGHTS = tuple(accumulate(INDUSTRY_WEIGHTS))
+
+# Former career levels of retirees, skewed towards senior roles
+RETIRED_LEVELS = (
+    CareerLevel.CL_5,
+    CareerLevel.CL_6,
+    CareerLevel.CL_7,
+    CareerLevel.CL_8,
+)
+RETIRED_LEVEL_WEIGHTS = (0.4, 0.3, 0.2, 0.1)
+_RETIRED_LEVEL_CUM_WEIGHTS = tuple(accumulate(RETIRED_LEVEL_WEIGHTS))
 
 
 def determine_career_level(age: int) -> CareerLevel:
@@ -23,62 +92,7 @@ def determine_career_level(age: int) -> CareerLevel:
     Returns:
         CareerLevel enum value
     """
-    if age < 22:
-        # College age - entry level only
-        return CareerLevel.CL_1
-    elif age < 25:
-        # Early career - mostly entry, some associate
-        return random.choices([CareerLevel.CL_1, CareerLevel.CL_2], weights=[0.8, 0.2])[
-            0
-        ]
-    elif age < 30:
-        # Building experience
-        return random.choices(
-            [CareerLevel.CL_1, CareerLevel.CL_2, CareerLevel.CL_3],
-            weights=[0.2, 0.6, 0.2],
-        )[0]
-    elif age < 35:
-        # Establishing career
-        return random.choices(
-            [CareerLevel.CL_2, CareerLevel.CL_3, CareerLevel.CL_4],
-            weights=[0.2, 0.6, 0.2],
-        )[0]
-    elif age < 40:
-        # Mid-career progression
-        return random.choices(
-            [CareerLevel.CL_3, CareerLevel.CL_4, CareerLevel.CL_5],
-            weights=[0.3, 0.5, 0.2],
-        )[0]
-    elif age < 45:
-        # Senior roles emerging
-        return random.choices(
-            [CareerLevel.CL_3, CareerLevel.CL_4, CareerLevel.CL_5, CareerLevel.CL_6],
-            weights=[0.2, 0.4, 0.3, 0.1],
-        )[0]
-    elif age < 50:
-        # Leadership roles
-        return random.choices(
-            [CareerLevel.CL_4, CareerLevel.CL_5, CareerLevel.CL_6, CareerLevel.CL_7],
-            weights=[0.2, 0.4, 0.3, 0.1],
-        )[0]
-    elif age < 55:
-        # Peak career years
-        return random.choices(
-            [CareerLevel.CL_5, CareerLevel.CL_6, CareerLevel.CL_7, CareerLevel.CL_8],
-            weights=[0.2, 0.4, 0.3, 0.1],
-        )[0]
-    elif age < 60:
-        # Senior leadership
-        return random.choices(
-            [CareerLevel.CL_6, CareerLevel.CL_7, CareerLevel.CL_8],
-            weights=[0.4, 0.4, 0.2],
-        )[0]
-    else:
-        # Near retirement - mix of senior roles and some stepping down
-        return random.choices(
-            [CareerLevel.CL_5, CareerLevel.CL_6, CareerLevel.CL_7, CareerLevel.CL_8],
-            weights=[0.2, 0.3, 0.3, 0.2],
-        )[0]
+    return draw_for_age(_CAREER_LEVEL_TABLE, age)
 
 
 def select_industry() -> str:
@@ -88,16 +102,7 @@ def select_industry() -> str:
     Returns:
         Industry key
     """
-    industries = [
-        "tech",
-        "business",
-        "sales_marketing",
-        "healthcare",
-        "education",
-        "general",
-    ]
-    weights = [0.15, 0.20, 0.20, 0.15, 0.10, 0.20]  # Realistic US job distribution
-    return random.choices(industries, weights=weights)[0]
+    return random.choices(INDUSTRIES, cum_weights=_INDUSTRY_CUM_WEIGHTS)[0]
 
 
 def calculate_salary(career_level: CareerLevel, industry: str, age: int) -> int:
@@ -187,8 +192,7 @@ def generate_unemployment_profile(age: int, employment_status: str) -> CareerPro
     elif employment_status == "Retired":
         # Retired - assume they had a senior career, now on fixed income
         career_level = random.choices(
-            [CareerLevel.CL_5, CareerLevel.CL_6, CareerLevel.CL_7, CareerLevel.CL_8],
-            weights=[0.4, 0.3, 0.2, 0.1],
+            RETIRED_LEVELS, cum_weights=_RETIRED_LEVEL_CUM_WEIGHTS
         )[0]
         job_title = "Retired"
         annual_income = random.randint(30000, 80000)  # Retirement income
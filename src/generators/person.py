@@ -3,19 +3,117 @@ Person profile generator with sanitization layer for realistic US data.
 Updated to use career progression helper for realistic job/salary correlation.
 """
 
+import multiprocessing
 import re
+from collections import deque
+from operator import attrgetter
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime, date, timezone
-from typing import Dict, Any, List, Optional, cast
-from dataclasses import dataclass, asdict
+from typing import Deque, Dict, Any, Iterator, List, Optional, cast
+from dataclasses import dataclass, field, fields
+from functools import lru_cache, partial
+from types import MappingProxyType
 from faker import Faker
 import uuid
 import random
 import numpy as np
-from utils import MIN_AGE, MAX_AGE, EMAIL_DOMAINS
+from utils import (
+    DATACLASS_SLOTS,
+    MIN_AGE,
+    MAX_AGE,
+    EMAIL_DOMAINS,
+    draw_for_age,
+    expand_age_brackets,
+)
 from generators.career import generate_career_profile, CareerLevel
 
-
-@dataclass
+# Patterns used while sanitizing every profile, compiled once
+TITLE_PATTERN = re.compile(r"^(Dr\.|Mr\.|Mrs\.|Ms\.|Prof\.|Rev\.|Hon\.|Sr\.|Jr\.)\s+")
+NON_ALPHA_PATTERN = re.compile(r"[^a-zA-Z]")
+NON_DIGIT_PATTERN = re.compile(r"\D")
+
+# Faker sex codes, drawn with equal probability as in Faker's profile()
+SEX_CODES = ("F", "M")
+
+# Faker sex codes mapped to our gender values
+GENDER_MAPPING = MappingProxyType({"M": "Male", "F": "Female"})
+
+BLOOD_TYPES = ("O+", "O-", "A+", "A-", "B+", "B-", "AB+", "AB-")
+
+# Education levels
+EDUCATION_LEVELS = (
+    "High School",
+    "Some College",
+    "Associate Degree",
+    "Bachelor's Degree",
+    "Master's Degree",
+    "Doctoral Degree",
+)
+
+# Marital statuses
+MARITAL_STATUSES = (
+    "Single",
+    "Married",
+    "Divorced",
+    "Widowed",
+    "Separated",
+)
+
+# Age-bracketed distributions: (upper age bound, options, weights). The final
+# bracket has no upper bound; weights of None mean a uniform choice.
+EMPLOYMENT_BY_AGE = (
+    # Young people more likely to be students or part-time
+    (22, ("Student", "Part-time", "Full-time"), (50, 35, 15)),
+    # Working age adults
+    (
+        65,
+        (
+            "Full-time",
+            "Part-time",
+            "Contract",
+            "Freelance",
+            "Self-employed",
+            "Unemployed",
+        ),
+        (70, 10, 8, 5, 5, 2),
+    ),
+    # Retirement age
+    (None, ("Retired", "Part-time", "Self-employed", "Full-time"), (70, 15, 10, 5)),
+)
+
+EDUCATION_BY_AGE = (
+    # Younger people less likely to have advanced degrees
+    (22, ("High School", "Some College", "Associate Degree"), (40, 50, 10)),
+    # Recent graduates
+    (
+        30,
+        (
+            "High School",
+            "Some College",
+            "Associate Degree",
+            "Bachelor's Degree",
+            "Master's Degree",
+        ),
+        (20, 25, 15, 35, 5),
+    ),
+    # Full distribution for older adults
+    (None, EDUCATION_LEVELS, None),
+)
+
+_EMPLOYMENT_TABLE = expand_age_brackets(EMPLOYMENT_BY_AGE)
+_EDUCATION_TABLE = expand_age_brackets(EDUCATION_BY_AGE)
+
+# Email local-part formats, filled in only for the one picked
+EMAIL_FORMATS = (
+    "{first[0]}.{last}",  # j.smith
+    "{first}.{last}",  # john.smith
+    "{first}{last}",  # johnsmith
+    "{first}_{last}",  # john_smith
+    "{first}{last[0]}",  # johns
+)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class PersonProfile:
     """Data class representing a person profile."""
 
@@ -57,12 +155,33 @@ class PersonProfile:
     country_code: str = "US"
 
     # Metadata
-    created_at: datetime = datetime.now(timezone.utc)
+    created_at: datetime = field(default_factory=partial(datetime.now, timezone.utc))
     created_by: str = "earth_generator"
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return asdict(self)
+        # Every field is a scalar, so asdict()'s recursive deep copy is wasted
+        return {name: getattr(self, name) for name in PERSON_FIELDS}
+
+
+# Field names in declaration (column) order, resolved once at import
+PERSON_FIELDS = tuple(f.name for f in fields(PersonProfile))
+
+
+def profiles_to_columns(profiles: List[PersonProfile]) -> Dict[str, List[Any]]:
+    """
+    Convert profiles to column-oriented data, one list per field.
+
+    Each column is built in a single pass, instead of allocating a dict per
+    profile and making DataFrame construction re-hash every key of every row.
+
+    Args:
+        profiles: PersonProfile objects
+
+    Returns:
+        Dict mapping field name to the values of that field, in profile order
+    """
+    return {name: list(map(attrgetter(name), profiles)) for name in PERSON_FIELDS}
 
 
 class PersonGenerator:
@@ -77,40 +196,18 @@ class PersonGenerator:
             seed: Random seed for reproducible results
         """
         self.fake = Faker(locale)
-        if seed:
-            Faker.seed(seed)
-            random.seed(seed)
+        if seed is not None:
+            self.seed(seed)
 
-        # Employment status options
-        self.employment_statuses = [
-            "Full-time",
-            "Part-time",
-            "Contract",
-            "Freelance",
-            "Unemployed",
-            "Student",
-            "Retired",
-            "Self-employed",
-        ]
+    def seed(self, seed: int) -> None:
+        """
+        Reseed the generator for reproducible results.
 
-        # Education levels
-        self.education_levels = [
-            "High School",
-            "Some College",
-            "Associate Degree",
-            "Bachelor's Degree",
-            "Master's Degree",
-            "Doctoral Degree",
-        ]
-
-        # Marital statuses
-        self.marital_statuses = [
-            "Single",
-            "Married",
-            "Divorced",
-            "Widowed",
-            "Separated",
-        ]
+        Seeds Faker's shared random source and the random module, so a
+        reused generator produces the same profiles as a fresh one.
+        """
+        Faker.seed(seed)
+        random.seed(seed)
 
     def _calculate_age(self, birth_date: date) -> int:
         """Calculate age from birth date."""
@@ -131,11 +228,8 @@ class PersonGenerator:
         Returns:
             Dict with first_name, last_name, and cleaned full_name
         """
-        # Common titles to remove
-        titles_pattern = r"^(Dr\.|Mr\.|Mrs\.|Ms\.|Prof\.|Rev\.|Hon\.|Sr\.|Jr\.)\s+"
-
         # Remove titles
-        cleaned_name = re.sub(titles_pattern, "", full_name.strip())
+        cleaned_name = TITLE_PATTERN.sub("", full_name.strip())
 
         # Split into parts
         name_parts = cleaned_name.split()
@@ -168,19 +262,12 @@ class PersonGenerator:
             Realistic email address
         """
         # Clean names for email (remove special chars, convert to lowercase)
-        clean_first = re.sub(r"[^a-zA-Z]", "", first_name).lower()
-        clean_last = re.sub(r"[^a-zA-Z]", "", last_name).lower()
-
-        # Various email formats
-        formats = [
-            f"{clean_first[0]}.{clean_last}",  # j.smith
-            f"{clean_first}.{clean_last}",  # john.smith
-            f"{clean_first}{clean_last}",  # johnsmith
-            f"{clean_first}_{clean_last}",  # john_smith
-            f"{clean_first}{clean_last[0]}",  # johns
-        ]
-
-        email_format = random.choice(formats)
+        clean_first = NON_ALPHA_PATTERN.sub("", first_name).lower()
+        clean_last = NON_ALPHA_PATTERN.sub("", last_name).lower()
+
+        email_format = random.choice(EMAIL_FORMATS).format(
+            first=clean_first, last=clean_last
+        )
         domain = random.choice(EMAIL_DOMAINS)
 
         return f"{email_format}@{domain}"
@@ -196,7 +283,7 @@ class PersonGenerator:
             Cleaned phone number in (XXX) XXX-XXXX format
         """
         # Extract only digits
-        digits = re.sub(r"\D", "", raw_phone)
+        digits = NON_DIGIT_PATTERN.sub("", raw_phone)
 
         # Ensure we have 10 digits for US phone numbers
         if len(digits) == 11 and digits[0] == "1":
@@ -210,8 +297,7 @@ class PersonGenerator:
 
     def _map_faker_gender(self, faker_sex: str) -> str:
         """Map Faker's sex field to our gender field."""
-        gender_mapping = {"M": "Male", "F": "Female"}
-        return gender_mapping.get(faker_sex, "Non-binary")
+        return GENDER_MAPPING.get(faker_sex, "Non-binary")
 
     def _sanitize_us_address(self, address: str) -> Dict[str, str]:
         """
@@ -241,30 +327,7 @@ class PersonGenerator:
         Returns:
             Employment status string
         """
-        if age < 22:
-            # Young people more likely to be students or part-time
-            return random.choices(
-                ["Student", "Part-time", "Full-time"], weights=[50, 35, 15]
-            )[0]
-        elif age < 65:
-            # Working age adults
-            return random.choices(
-                [
-                    "Full-time",
-                    "Part-time",
-                    "Contract",
-                    "Freelance",
-                    "Self-employed",
-                    "Unemployed",
-                ],
-                weights=[70, 10, 8, 5, 5, 2],
-            )[0]
-        else:
-            # Retirement age
-            return random.choices(
-                ["Retired", "Part-time", "Self-employed", "Full-time"],
-                weights=[70, 15, 10, 5],
-            )[0]
+        return draw_for_age(_EMPLOYMENT_TABLE, age)
 
     def _get_age_appropriate_education(self, age: int) -> str:
         """
@@ -276,37 +339,35 @@ class PersonGenerator:
         Returns:
             Education level string
         """
-        if age < 22:
-            # Younger people less likely to have advanced degrees
-            return random.choices(
-                ["High School", "Some College", "Associate Degree"],
-                weights=[40, 50, 10],
-            )[0]
-        elif age < 30:
-            # Recent graduates
-            return random.choices(
-                [
-                    "High School",
-                    "Some College",
-                    "Associate Degree",
-                    "Bachelor's Degree",
-                    "Master's Degree",
-                ],
-                weights=[20, 25, 15, 35, 5],
-            )[0]
-        else:
-            # Full distribution for older adults
-            return random.choice(self.education_levels)
+        return draw_for_age(_EDUCATION_TABLE, age)
+
+    def _base_profile(self) -> Dict[str, Any]:
+        """
+        Draw the Faker profile fields this generator uses.
+
+        Same distributions as Faker's profile(), without the job, company,
+        geo, website and blood group fields it builds and we discard.
+        """
+        sex = self.fake.random_element(SEX_CODES)
+        name = self.fake.name_female() if sex == "F" else self.fake.name_male()
+        return {
+            "name": name,
+            "sex": sex,
+            "username": self.fake.user_name(),
+            "address": self.fake.address(),
+            "ssn": self.fake.ssn(),
+            "birthdate": self.fake.date_of_birth(),
+        }
 
     def generate_profile(self) -> PersonProfile:
         """Generate a single sanitized person profile for US residents."""
 
-        # Generate base profile using Faker's profile() function
-        base_profile = self.fake.profile()
+        # Generate base profile from the Faker providers we need
+        base_profile = self._base_profile()
 
         # Extract and clamp age
         birth_date = cast(date, base_profile["birthdate"])
-        age = np.clip(self._calculate_age(birth_date), MIN_AGE, MAX_AGE)
+        age = min(max(self._calculate_age(birth_date), MIN_AGE), MAX_AGE)
 
         # Clean name and extract components
         name_data = self._clean_name(cast(str, base_profile["name"]))
@@ -336,10 +397,10 @@ class PersonGenerator:
         # Generate additional fields
         ipv4_address = self.fake.ipv4()
         user_agent = self.fake.user_agent()
-        blood_type = random.choice(["O+", "O-", "A+", "A-", "B+", "B-", "AB+", "AB-"])
+        blood_type = random.choice(BLOOD_TYPES)
         height_cm = random.randint(150, 200)
         weight_kg = random.randint(50, 120)
-        marital_status = random.choice(self.marital_statuses)
+        marital_status = random.choice(MARITAL_STATUSES)
 
         # Create PersonProfile with sanitized data and career information
         profile = PersonProfile(
@@ -380,6 +441,20 @@ class PersonGenerator:
         return profile
 
 
+@lru_cache(maxsize=None)
+def _shared_generator(locale: str) -> PersonGenerator:
+    """Return this process's generator for a locale, built on first use."""
+    return PersonGenerator(locale=locale)
+
+
+def _generator_for(locale: str, seed: Optional[int]) -> PersonGenerator:
+    """Fetch the shared generator for a locale, reseeded if a seed is given."""
+    generator = _shared_generator(locale)
+    if seed is not None:
+        generator.seed(seed)
+    return generator
+
+
 def generate_person(locale: str = "en_US", seed: Optional[int] = None) -> PersonProfile:
     """
     Generate a single person profile.
@@ -391,8 +466,7 @@ def generate_person(locale: str = "en_US", seed: Optional[int] = None) -> Person
     Returns:
         PersonProfile object
     """
-    generator = PersonGenerator(locale=locale, seed=seed)
-    return generator.generate_profile()
+    return _generator_for(locale, seed).generate_profile()
 
 
 def generate_multiple_persons(
@@ -409,10 +483,105 @@ def generate_multiple_persons(
     Returns:
         List of PersonProfile objects
     """
-    generator = PersonGenerator(locale=locale, seed=seed)
+    generator = _generator_for(locale, seed)
     return [generator.generate_profile() for _ in range(count)]
 
 
+def iter_person_batches(
+    count: int,
+    batch_size: int = 1000,
+    locale: str = "en_US",
+    seed: Optional[int] = None,
+    workers: int = 1,
+    skip_batches: int = 0,
+) -> Iterator[List[PersonProfile]]:
+    """
+    Generate person profiles as a stream of fixed-size batches.
+
+    Only the current batch is held in memory, so callers can store each one
+    before the next is built. With workers > 1 the batches are generated in
+    a process pool instead.
+
+    Each batch is seeded from its own child of `seed`, whichever process
+    builds it, so output depends only on seed and batch_size and is the same
+    for any number of workers. Skipped batches are planned but not built, so
+    the rest come out exactly as they would in the full run.
+
+    Args:
+        count: Total number of profiles to generate
+        batch_size: Maximum number of profiles per batch
+        locale: Faker locale for generated data
+        seed: Random seed for reproducible results
+        workers: Number of worker processes used for generation
+        skip_batches: Number of leading batches to leave out, such as those
+            an interrupted run already stored
+
+    Yields:
+        Lists of at most batch_size PersonProfile objects
+    """
+    sizes = _batch_sizes(count, batch_size)
+
+    # Independent per-batch seeds; with seed=None these come from OS entropy.
+    # Seeds are spawned for the whole plan before skipping, so each batch
+    # keeps the seed it has in the full run.
+    batch_seeds = [
+        int(child.generate_state(1)[0])
+        for child in np.random.SeedSequence(seed).spawn(len(sizes))
+    ]
+    sizes, batch_seeds = sizes[skip_batches:], batch_seeds[skip_batches:]
+
+    # A single worker or batch has nothing to overlap, so build the batches
+    # here from the same seeds rather than paying to start a pool
+    if workers <= 1 or len(sizes) <= 1:
+        for size, batch_seed in zip(sizes, batch_seeds):
+            yield _generate_batch(size, locale, batch_seed)
+        return
+
+    # Never start more processes than there are batches
+    yield from _iter_person_batches_parallel(
+        sizes, batch_seeds, locale, min(workers, len(sizes))
+    )
+
+
+def _batch_sizes(count: int, batch_size: int) -> List[int]:
+    """Plan the size of every batch up front: full batches, then any remainder."""
+    full_batches, remainder = divmod(count, batch_size)
+    return [batch_size] * full_batches + ([remainder] if remainder else [])
+
+
+def _generate_batch(size: int, locale: str, seed: int) -> List[PersonProfile]:
+    """Generate one batch of profiles from its own seed, in any process."""
+    generator = _generator_for(locale, seed)
+    return [generator.generate_profile() for _ in range(size)]
+
+
+def _iter_person_batches_parallel(
+    sizes: List[int], batch_seeds: List[int], locale: str, workers: int
+) -> Iterator[List[PersonProfile]]:
+    """Generate batches across a process pool, yielding them in order."""
+    # Spawn rather than fork: the pool is started from the prefetch thread
+    # while DuckDB's threads are running, and forking a multithreaded
+    # process can deadlock the child
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        pending: Deque[Future] = deque()
+        try:
+            for size, batch_seed in zip(sizes, batch_seeds):
+                pending.append(
+                    executor.submit(_generate_batch, size, locale, batch_seed)
+                )
+                # Bound the work in flight so memory stays O(workers * batch)
+                if len(pending) >= workers * 2:
+                    yield pending.popleft().result()
+
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
 # Example usage and testing
 if __name__ == "__main__":
     # Generate a few sample profiles to test career progression
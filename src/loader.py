@@ -2,19 +2,39 @@
 DuckDB interface module for CRUD operations and database management.
 """
 
+import atexit
+import functools
 import logging
+import sys
+import weakref
 from datetime import datetime
 from pathlib import Path
-from typing import Union, Optional, Any, Dict, List
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from dataclasses import dataclass
 
 import duckdb
-import pandas as pd
 
+from utils import DATACLASS_SLOTS
 
-@dataclass
+# pandas is only needed for DataFrame reads and record-list writes, so it is
+# imported where used rather than on every CLI start
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class DatabaseConfig:
-    """Configuration for DuckDB connection."""
+    """Configuration for DuckDB connection. Immutable once created."""
 
     data_dir: Path = Path("data")
     env: str = "dev"
@@ -50,8 +70,15 @@ class DatabaseConfig:
         return f"DatabaseConfig(env={self.env}, db_path={self.db_path}, schema={self.schema_name})"
 
 
+@functools.lru_cache(maxsize=1)
 def setup_logging() -> logging.Logger:
-    """Set up logging configuration."""
+    """
+    Set up logging configuration.
+
+    Cached so that log(), which is called on every table operation, doesn't
+    re-create the log directory and re-check handlers each time. Call
+    setup_logging.cache_clear() to force a fresh setup.
+    """
     # Create logs directory structure
     log_dir = Path("logs/loader")
     log_dir.mkdir(parents=True, exist_ok=True)
@@ -87,6 +114,15 @@ def setup_logging() -> logging.Logger:
     return logger
 
 
+# Level names accepted by log(); anything else logs at INFO
+LOG_LEVELS = {
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "debug": logging.DEBUG,
+}
+
+
 def log(message: str, level: str = "info") -> None:
     """
     Utility function for logging messages.
@@ -95,17 +131,102 @@ def log(message: str, level: str = "info") -> None:
         message: Message to log
         level: Log level ('info', 'warning', 'error', 'debug')
     """
-    logger = setup_logging()
+    setup_logging().log(LOG_LEVELS.get(level.lower(), logging.INFO), message)
+
+
+# Cached row counts and column listings per connection, keyed by
+# "schema.table". operate_on_table updates the counts after each committed
+# write and drops entries when a table is replaced, cleared or a write fails.
+_row_counts: weakref.WeakKeyDictionary[duckdb.DuckDBPyConnection, Dict[str, int]] = (
+    weakref.WeakKeyDictionary()
+)
+_table_columns: weakref.WeakKeyDictionary[
+    duckdb.DuckDBPyConnection, Dict[str, List[Dict[str, Any]]]
+] = weakref.WeakKeyDictionary()
+
+
+def _forget_table(conn: duckdb.DuckDBPyConnection, full_table_name: str) -> None:
+    """Invalidate the cached row count and columns for a table."""
+    for cache in (_row_counts, _table_columns):
+        entries = cache.get(conn)
+        if entries is not None:
+            entries.pop(full_table_name, None)
+
+
+def _is_dataframe(obj: Any) -> bool:
+    """Check for a pandas DataFrame without importing pandas."""
+    pandas = sys.modules.get("pandas")
+    return pandas is not None and isinstance(obj, pandas.DataFrame)
+
+
+def _sql_literal(value: str) -> str:
+    """
+    Quote a string as a SQL literal.
+
+    Used for catalog lookups instead of bound parameters, because binding
+    Python values makes DuckDB import pandas.
+    """
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _note_rows_written(
+    conn: duckdb.DuckDBPyConnection,
+    full_table_name: str,
+    rows: int,
+    replaced: bool,
+) -> None:
+    """
+    Keep the cached row count in step with a committed write.
+
+    A replaced (or newly created) table holds exactly the written rows; an
+    append adds to a known count. Replacing may change the columns, so
+    their cached listing is dropped.
+    """
+    counts = _row_counts.setdefault(conn, {})
+    if replaced:
+        _forget_table(conn, full_table_name)
+        counts[full_table_name] = rows
+    elif full_table_name in counts:
+        counts[full_table_name] += rows
 
-    level_map = {
-        "info": logger.info,
-        "warning": logger.warning,
-        "error": logger.error,
-        "debug": logger.debug,
-    }
 
-    log_func = level_map.get(level.lower(), logger.info)
-    log_func(message)
+def count_rows(
+    conn: duckdb.DuckDBPyConnection,
+    schema_name: str,
+    table_name: str,
+    cache: bool = True,
+) -> int:
+    """
+    Get the number of rows in a table.
+
+    Counts are cached per connection and kept up to date by operate_on_table
+    writes and clears, so repeated status lookups don't rescan the table.
+    Writes made outside operate_on_table are not tracked; pass cache=False
+    to force a fresh COUNT(*).
+
+    Args:
+        conn: DuckDB connection object
+        schema_name: Schema name
+        table_name: Table name
+        cache: Whether to use and populate the cached count
+
+    Returns:
+        Row count, or 0 if the table does not exist
+    """
+    full_table_name = f"{schema_name}.{table_name}"
+    counts = _row_counts.setdefault(conn, {})
+
+    if cache and full_table_name in counts:
+        return counts[full_table_name]
+
+    try:
+        result = conn.execute(f"SELECT COUNT(*) FROM {full_table_name}").fetchone()
+    except duckdb.CatalogException:
+        return 0
+
+    row_count = result[0] if result else 0
+    counts[full_table_name] = row_count
+    return row_count
 
 
 def connect_to_duckdb(
@@ -138,17 +259,231 @@ def connect_to_duckdb(
         raise
 
 
+# Database handles shared per file, opened on first use by get_connection,
+# and the (database, schema) pairs already created through them
+_connections: Dict[str, duckdb.DuckDBPyConnection] = {}
+_ensured_schemas: Set[Tuple[str, str]] = set()
+
+
+def get_connection(
+    config: Optional[DatabaseConfig] = None,
+) -> duckdb.DuckDBPyConnection:
+    """
+    Return a cursor on the shared connection for a database.
+
+    The database file is opened once per process; every caller gets its own
+    cursor on that handle, so reconnecting doesn't throw away DuckDB's caches
+    and cursors can be used from separate threads. Closing a cursor leaves
+    the shared handle open; close_connections() closes those, and is also
+    run at interpreter exit.
+
+    The configured schema is created at most once per database per process;
+    schemas dropped outside the loader are not re-created.
+
+    Args:
+        config: Database configuration object
+
+    Returns:
+        DuckDB cursor on the shared connection
+    """
+    if config is None:
+        config = DatabaseConfig.for_dev()
+
+    db_path = str(config.db_path)
+    shared = _connections.get(db_path)
+    if shared is None:
+        shared = connect_to_duckdb(config)
+        _connections[db_path] = shared
+        _ensured_schemas.add((db_path, config.schema_name))
+        return shared.cursor()
+
+    cursor = shared.cursor()
+    if (db_path, config.schema_name) not in _ensured_schemas:
+        cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {config.schema_name}")
+        _ensured_schemas.add((db_path, config.schema_name))
+    return cursor
+
+
+def close_connections() -> None:
+    """Close every shared connection opened by get_connection."""
+    _ensured_schemas.clear()
+    while _connections:
+        db_path, conn = _connections.popitem()
+        conn.close()
+        log(f"Closed shared connection to {db_path}")
+
+
+# Checkpoint and release shared handles even if a caller never closes them
+atexit.register(close_connections)
+
+
+def _table_exists(
+    conn: duckdb.DuckDBPyConnection, schema_name: str, table_name: str
+) -> bool:
+    """
+    Check the catalog for a table.
+
+    A catalog lookup never raises for a missing table, so only real
+    database errors propagate.
+    """
+    result = conn.execute(
+        "SELECT COUNT(*) FROM information_schema.tables "
+        f"WHERE table_schema = {_sql_literal(schema_name)} "
+        f"AND table_name = {_sql_literal(table_name)}"
+    ).fetchone()
+    return result[0] > 0 if result else False
+
+
+def _ping_table(
+    conn: duckdb.DuckDBPyConnection,
+    schema_name: str,
+    table_name: str,
+    object_data: Any,
+    query: Optional[str],
+    how: str,
+) -> bool:
+    """Check if table exists."""
+    exists = _table_exists(conn, schema_name, table_name)
+    log(f"Table {schema_name}.{table_name} exists: {exists}")
+    return exists
+
+
+def _read_table(
+    conn: duckdb.DuckDBPyConnection,
+    schema_name: str,
+    table_name: str,
+    object_data: Any,
+    query: Optional[str],
+    how: str,
+) -> "pd.DataFrame":
+    """Read data from table."""
+    full_table_name = f"{schema_name}.{table_name}"
+    if query is None:
+        query = f"SELECT * FROM {full_table_name}"
+
+    log(f"Reading from {full_table_name} with query: {query}")
+    df = conn.execute(query).df()
+    log(f"Read {len(df)} rows from {full_table_name}")
+    return df
+
+
+def _write_table(
+    conn: duckdb.DuckDBPyConnection,
+    schema_name: str,
+    table_name: str,
+    object_data: Any,
+    query: Optional[str],
+    how: str,
+) -> None:
+    """Write data to table."""
+    full_table_name = f"{schema_name}.{table_name}"
+    if object_data is None:
+        raise ValueError("object_data is required for write operations")
+
+    # Convert data to DataFrame if needed. DataFrames and Arrow tables
+    # (sized objects exposing __arrow_c_stream__) are scanned in place.
+    # One-shot streams such as a RecordBatchReader are rejected: their
+    # row count is needed up front and can't be read without consuming them.
+    if isinstance(object_data, (dict, list)):
+        import pandas as pd
+
+        records = [object_data] if isinstance(object_data, dict) else object_data
+        data = pd.DataFrame(records)
+    elif _is_dataframe(object_data) or (
+        hasattr(object_data, "__arrow_c_stream__") and hasattr(object_data, "__len__")
+    ):
+        data = object_data
+    else:
+        raise ValueError(f"Unsupported object_data type: {type(object_data)}")
+
+    # Runs once per batch, so messages are formatted lazily by the logger
+    # rather than built up front with f-strings
+    logger = setup_logging()
+    if how == "truncate":
+        logger.info("Truncating and writing %d rows to %s", len(data), full_table_name)
+    else:
+        logger.info("Appending %d rows to %s", len(data), full_table_name)
+
+    # Insert through a relation so DuckDB copies the columns directly,
+    # without registering a named view or parsing an INSERT statement
+    relation = conn.from_df(data) if _is_dataframe(data) else conn.from_arrow(data)
+
+    # Drop and recreate in one transaction so a failed write never
+    # leaves the table dropped. The connection's transaction methods
+    # skip parsing a statement for each batch.
+    replaced = how == "truncate"
+    committed = False
+    conn.begin()
+    try:
+        if replaced:
+            conn.execute(f"DROP TABLE IF EXISTS {full_table_name}")
+        elif full_table_name not in _row_counts.get(conn, {}):
+            # Tables with a cached row count are known to exist, so only
+            # the first append to a table pays for the catalog lookup and
+            # the COUNT(*) that seeds its count for the appends after it
+            replaced = not _table_exists(conn, schema_name, table_name)
+            if not replaced:
+                count_rows(conn, schema_name, table_name, cache=False)
+
+        if replaced:
+            # Create table from data
+            relation.create(full_table_name)
+        else:
+            # Insert into existing table
+            relation.insert_into(full_table_name)
+
+        conn.commit()
+        committed = True
+    except duckdb.Error:
+        conn.rollback()
+        raise
+    finally:
+        if committed:
+            _note_rows_written(conn, full_table_name, len(data), replaced)
+        else:
+            _forget_table(conn, full_table_name)
+
+    logger.info("Successfully wrote data to %s", full_table_name)
+
+
+def _clear_table(
+    conn: duckdb.DuckDBPyConnection,
+    schema_name: str,
+    table_name: str,
+    object_data: Any,
+    query: Optional[str],
+    how: str,
+) -> None:
+    """Delete every row, keeping the table."""
+    full_table_name = f"{schema_name}.{table_name}"
+    if _table_exists(conn, schema_name, table_name):
+        conn.execute(f"DELETE FROM {full_table_name}")
+        _forget_table(conn, full_table_name)
+        log(f"Cleared all data from {full_table_name}")
+    else:
+        log(f"Table {full_table_name} does not exist, nothing to clear")
+
+
+# Handlers for operate_on_table, keyed by action name
+TABLE_ACTIONS: Dict[str, Callable[..., Union[bool, "pd.DataFrame", None]]] = {
+    "ping": _ping_table,
+    "read": _read_table,
+    "write": _write_table,
+    "clear": _clear_table,
+}
+
+
 def operate_on_table(
     conn: duckdb.DuckDBPyConnection,
     schema_name: str,
     table_name: str,
     action: str,
     object_data: Optional[
-        Union[pd.DataFrame, List[Dict[str, Any]], Dict[str, Any]]
+        Union["pd.DataFrame", List[Dict[str, Any]], Dict[str, Any]]
     ] = None,
     query: Optional[str] = None,
     how: str = "append",
-) -> Union[bool, pd.DataFrame, None]:
+) -> Union[bool, "pd.DataFrame", None]:
     """
     Control database table operations based on action parameter.
 
@@ -157,7 +492,9 @@ def operate_on_table(
         schema_name: Schema name
         table_name: Table name
         action: Action to perform ('ping', 'read', 'write', 'clear')
-        object_data: Data object for write operations
+        object_data: Data for write operations (DataFrame, Arrow table,
+            list of records, or a single record dict). Unsized Arrow
+            streams such as a RecordBatchReader are not accepted.
         query: SQL query string for read operations
         how: Write method ('append' or 'truncate')
 
@@ -166,79 +503,11 @@ def operate_on_table(
         - pd.DataFrame for 'read' action
         - None for 'write' and 'clear' actions
     """
-    full_table_name = f"{schema_name}.{table_name}"
-
     try:
-        if action == "ping":
-            # Check if table exists
-            try:
-                result = conn.execute(
-                    f"SELECT COUNT(*) FROM information_schema.tables "
-                    f"WHERE table_schema = '{schema_name}' AND table_name = '{table_name}'"
-                ).fetchone()
-                exists = result[0] > 0 if result else False
-                log(f"Table {full_table_name} exists: {exists}")
-                return exists
-            except Exception:
-                log(f"Table {full_table_name} does not exist")
-                return False
-
-        elif action == "read":
-            # Read data from table
-            if query is None:
-                query = f"SELECT * FROM {full_table_name}"
-
-            log(f"Reading from {full_table_name} with query: {query}")
-            df = conn.execute(query).df()
-            log(f"Read {len(df)} rows from {full_table_name}")
-            return df
-
-        elif action == "write":
-            # Write data to table
-            if object_data is None:
-                raise ValueError("object_data is required for write operations")
-
-            # Convert data to DataFrame if needed
-            if isinstance(object_data, dict):
-                df = pd.DataFrame([object_data])
-            elif isinstance(object_data, list):
-                df = pd.DataFrame(object_data)
-            elif isinstance(object_data, pd.DataFrame):
-                df = object_data
-            else:
-                raise ValueError(f"Unsupported object_data type: {type(object_data)}")
-
-            if how == "truncate":
-                log(f"Truncating and writing {len(df)} rows to {full_table_name}")
-                conn.execute(f"DROP TABLE IF EXISTS {full_table_name}")
-            else:
-                log(f"Appending {len(df)} rows to {full_table_name}")
-
-            # Register DataFrame as temporary table and insert
-            conn.register("temp_df", df)
-
-            if how == "truncate" or not operate_on_table(
-                conn, schema_name, table_name, "ping"
-            ):
-                # Create table from DataFrame
-                conn.execute(f"CREATE TABLE {full_table_name} AS SELECT * FROM temp_df")
-            else:
-                # Insert into existing table
-                conn.execute(f"INSERT INTO {full_table_name} SELECT * FROM temp_df")
-
-            conn.unregister("temp_df")
-            log(f"Successfully wrote data to {full_table_name}")
-            return None
-        elif action == "clear":
-            # Truncate table
-            if operate_on_table(conn, schema_name, table_name, "ping"):
-                conn.execute(f"DELETE FROM {full_table_name}")
-                log(f"Cleared all data from {full_table_name}")
-            else:
-                log(f"Table {full_table_name} does not exist, nothing to clear")
-            return None
-        else:
+        handler = TABLE_ACTIONS.get(action)
+        if handler is None:
             raise ValueError(f"Unknown action: {action}")
+        return handler(conn, schema_name, table_name, object_data, query, how)
 
     except Exception as e:
         log(f"Error in operate_on_table: {str(e)}", "error")
@@ -246,38 +515,64 @@ def operate_on_table(
 
 
 def get_table_info(
-    conn: duckdb.DuckDBPyConnection, schema_name: str, table_name: str
+    conn: duckdb.DuckDBPyConnection,
+    schema_name: str,
+    table_name: str,
+    cache: bool = True,
 ) -> Dict[str, Any]:
     """
     Get information about a table including row count and schema.
 
+    Column listings and row counts are cached per connection alongside
+    count_rows, with the same invalidation rules.
+
     Args:
         conn: DuckDB connection object
         schema_name: Schema name
         table_name: Table name
+        cache: Whether to use and populate the cached metadata
 
     Returns:
-        Dictionary with table information
+        Dictionary with table information. "exists" is False only when the
+        catalog lists no columns for the table.
+
+    Raises:
+        duckdb.Error: If the database can't be queried
     """
     full_table_name = f"{schema_name}.{table_name}"
+    cached_columns = _table_columns.setdefault(conn, {})
 
-    if not operate_on_table(conn, schema_name, table_name, "ping"):
-        return {"exists": False, "row_count": 0, "columns": []}
-
-    try:
-        # Get row count
-        result = conn.execute(f"SELECT COUNT(*) FROM {full_table_name}").fetchone()
-        row_count = result[0] if result else 0
-
-        # Get column information
-        columns = conn.execute(f"DESCRIBE {full_table_name}").df()
-
+    if cache and full_table_name in cached_columns:
         return {
             "exists": True,
-            "row_count": row_count,
-            "columns": columns.to_dict("records"),
+            "row_count": count_rows(conn, schema_name, table_name),
+            "columns": list(cached_columns[full_table_name]),
         }
 
-    except Exception as e:
-        log(f"Error getting table info: {str(e)}", "error")
+    # One catalog probe answers both "does it exist" and "what columns"
+    query = f"""
+        SELECT
+            column_name,
+            data_type AS column_type,
+            is_nullable AS "null",
+            column_default AS "default"
+        FROM information_schema.columns
+        WHERE table_schema = {_sql_literal(schema_name)}
+            AND table_name = {_sql_literal(table_name)}
+        ORDER BY ordinal_position
+        """
+    result = conn.execute(query)
+    names = [description[0] for description in result.description]
+    column_records = [dict(zip(names, row)) for row in result.fetchall()]
+
+    if not column_records:
         return {"exists": False, "row_count": 0, "columns": []}
+
+    cached_columns[full_table_name] = column_records
+    row_count = count_rows(conn, schema_name, table_name, cache=cache)
+
+    return {
+        "exists": True,
+        "row_count": row_count,
+        "columns": list(column_records),
+    }
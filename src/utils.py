@@ -1,11 +1,61 @@
+import random
+import sys
+from bisect import bisect_right
 from dataclasses import dataclass
 from enum import IntEnum
+from itertools import accumulate
+from types import MappingProxyType
+from typing import Mapping, Optional, Sequence, Tuple, TypeVar
+
+# dataclass options for per-instance __slots__ (no __dict__) on Python 3.10+;
+# on 3.9 the classes fall back to regular instances
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 MIN_AGE = 18
 MAX_AGE = 85
 
+T = TypeVar("T")
+
+# One bracket of an age-based distribution: (upper age bound, options,
+# weights). The final bracket has no upper bound; weights of None mean a
+# uniform choice.
+AgeBracket = Tuple[Optional[int], Tuple[T, ...], Optional[Tuple[float, ...]]]
+
+# Brackets expanded for drawing: bisect bounds, then (options, cumulative
+# weights) per bracket
+AgeTable = Tuple[
+    Tuple[int, ...], Tuple[Tuple[Tuple[T, ...], Optional[Tuple[float, ...]]], ...]
+]
+
+
+def expand_age_brackets(brackets: Sequence[AgeBracket[T]]) -> AgeTable[T]:
+    """
+    Expand age brackets once, so each draw is a bisect plus one choice.
+
+    Cumulative weights are precomputed so random.choices doesn't
+    re-accumulate them on every call.
+    """
+    bounds = tuple(bound for bound, _, _ in brackets if bound is not None)
+    choices = tuple(
+        (options, tuple(accumulate(weights)) if weights else None)
+        for _, options, weights in brackets
+    )
+    return bounds, choices
+
+
+def draw_for_age(table: AgeTable[T], age: int) -> T:
+    """Draw an option from the bracket an age falls in."""
+    bounds, choices = table
+    options, cum_weights = choices[bisect_right(bounds, age)]
+    if len(options) == 1:
+        return options[0]
+    if cum_weights is None:
+        return random.choice(options)
+    return random.choices(options, cum_weights=cum_weights)[0]
+
+
 # Common US job titles by category
-US_JOB_TITLES = [
+US_JOB_TITLES = (
     # Professional/Office
     "Software Engineer",
     "Accountant",
@@ -71,10 +121,10 @@ US_JOB_TITLES = [
     "Artist",
     "Writer",
     "Consultant",
-]
+)
 
 # Email domains for realistic email generation
-EMAIL_DOMAINS = ["gmail.com", "yahoo.com", "hotmail.com", "aol.com", "msn.com"]
+EMAIL_DOMAINS = ("gmail.com", "yahoo.com", "hotmail.com", "aol.com", "msn.com")
 
 
 class CareerLevel(IntEnum):
@@ -90,7 +140,7 @@ class CareerLevel(IntEnum):
     CL_8 = 8  # C-Suite / Executive
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CareerProfile:
     """Career profile containing level, title, and salary."""
 
@@ -100,7 +150,7 @@ class CareerProfile:
 
 
 # Career level job titles by industry vertical
-CAREER_TITLES = {
+_CAREER_TITLES = {
     # Technology
     "tech": {
         CareerLevel.CL_1: [
@@ -400,24 +450,38 @@ CAREER_TITLES = {
     },
 }
 
+# Read-only views, so the shared lookup tables can't be changed by callers
+CAREER_TITLES: Mapping[str, Mapping[CareerLevel, Tuple[str, ...]]] = MappingProxyType(
+    {
+        industry: MappingProxyType(
+            {level: tuple(titles) for level, titles in levels.items()}
+        )
+        for industry, levels in _CAREER_TITLES.items()
+    }
+)
+
 # Base salary ranges by career level (2025 US market)
-SALARY_RANGES = {
-    CareerLevel.CL_1: (35000, 55000),  # Entry level
-    CareerLevel.CL_2: (45000, 70000),  # Associate
-    CareerLevel.CL_3: (60000, 90000),  # Mid-level
-    CareerLevel.CL_4: (80000, 120000),  # Senior
-    CareerLevel.CL_5: (100000, 150000),  # Lead/Manager
-    CareerLevel.CL_6: (130000, 200000),  # Director
-    CareerLevel.CL_7: (180000, 300000),  # VP
-    CareerLevel.CL_8: (250000, 500000),  # C-Suite
-}
+SALARY_RANGES: Mapping[CareerLevel, Tuple[int, int]] = MappingProxyType(
+    {
+        CareerLevel.CL_1: (35000, 55000),  # Entry level
+        CareerLevel.CL_2: (45000, 70000),  # Associate
+        CareerLevel.CL_3: (60000, 90000),  # Mid-level
+        CareerLevel.CL_4: (80000, 120000),  # Senior
+        CareerLevel.CL_5: (100000, 150000),  # Lead/Manager
+        CareerLevel.CL_6: (130000, 200000),  # Director
+        CareerLevel.CL_7: (180000, 300000),  # VP
+        CareerLevel.CL_8: (250000, 500000),  # C-Suite
+    }
+)
 
 # Industry salary multipliers
-INDUSTRY_MULTIPLIERS = {
-    "tech": 1.3,  # Tech pays premium
-    "business": 1.1,  # Finance/consulting premium
-    "sales_marketing": 1.0,  # Average market
-    "healthcare": 1.1,  # Healthcare premium
-    "education": 0.8,  # Education typically lower
-    "general": 0.9,  # General/services below average
-}
+INDUSTRY_MULTIPLIERS: Mapping[str, float] = MappingProxyType(
+    {
+        "tech": 1.3,  # Tech pays premium
+        "business": 1.1,  # Finance/consulting premium
+        "sales_marketing": 1.0,  # Average market
+        "healthcare": 1.1,  # Healthcare premium
+        "education": 0.8,  # Education typically lower
+        "general": 0.9,  # General/services below average
+    }
+)
@@ -4,15 +4,33 @@ Unit test script for Earth's core functionality.
 """
 
 import sys
+import tempfile
+import threading
+import time
 from pathlib import Path
 
 project_root = Path(__file__).parent.parent
 src_path = project_root / "src"
 
+# The CLI lives in app/ as a script rather than a package
+sys.path.insert(0, str(project_root / "app"))
+
 try:
-    from loader import DatabaseConfig, connect_to_duckdb, operate_on_table, log
-    from generators.person import generate_multiple_persons
+    from loader import (
+        DatabaseConfig,
+        connect_to_duckdb,
+        operate_on_table,
+        get_table_info,
+        count_rows,
+        get_connection,
+        close_connections,
+        log,
+    )
+    import loader
+    from generators.person import generate_multiple_persons, iter_person_batches
+    import duckdb
     import pandas as pd
+    import main as cli
 
     print("✅ All imports successful!")
 except ImportError as e:
@@ -46,6 +64,83 @@ def test_person_generation():
         return False
 
 
+def test_batch_reproducibility():
+    """Test that seeded batches don't depend on the number of workers."""
+    print("\n🧪 Testing batch reproducibility...")
+
+    def generated_rows(workers):
+        # person_id and created_at are never seeded
+        return [
+            {
+                name: value
+                for name, value in person.to_dict().items()
+                if name not in ("person_id", "created_at")
+            }
+            for batch in iter_person_batches(
+                25, batch_size=10, seed=42, workers=workers
+            )
+            for person in batch
+        ]
+
+    try:
+        serial = generated_rows(1)
+        assert len(serial) == 25, "Should generate 25 persons"
+        assert generated_rows(1) == serial, "Same seed should give the same rows"
+        assert generated_rows(2) == serial, "Worker count shouldn't change rows"
+
+        print("✅ Batch reproducibility test passed")
+        return True
+
+    except Exception as e:
+        print(f"❌ Batch reproducibility test failed: {e}")
+        return False
+
+
+def test_choose_batch_size():
+    """Test batch sizing against the memory budget."""
+    print("\n🧪 Testing batch sizing...")
+
+    try:
+        by_memory = cli.BATCH_MEMORY_BUDGET // (
+            cli.APPROX_PROFILE_BYTES * cli.MAX_BATCHES_HELD
+        )
+        assert by_memory > cli.MIN_BATCH_SIZE, "Budget should allow large batches"
+
+        # A typical large run gets batches well above the old fixed 1000 rows
+        assert cli.choose_batch_size(150_000) >= 4000, "Default batches too small"
+
+        # Small runs fit in one batch
+        assert cli.choose_batch_size(1) == 1, "One record is one batch"
+        assert cli.choose_batch_size(cli.MIN_BATCH_SIZE) == cli.MIN_BATCH_SIZE
+        assert cli.choose_batch_size(by_memory) == by_memory
+
+        # Larger runs are capped by the budget
+        assert cli.choose_batch_size(by_memory + 1) == by_memory
+        assert cli.choose_batch_size(10_000_000) == by_memory
+        assert (
+            by_memory * cli.APPROX_PROFILE_BYTES * cli.MAX_BATCHES_HELD
+            <= cli.BATCH_MEMORY_BUDGET
+        ), "Held batches should fit the budget"
+
+        # A budget too small for MIN_BATCH_SIZE still gets the minimum
+        budget = cli.BATCH_MEMORY_BUDGET
+        cli.BATCH_MEMORY_BUDGET = 1
+        try:
+            assert cli.choose_batch_size(10_000_000) == cli.MIN_BATCH_SIZE
+            assert cli.choose_batch_size(cli.MIN_BATCH_SIZE - 1) == (
+                cli.MIN_BATCH_SIZE - 1
+            )
+        finally:
+            cli.BATCH_MEMORY_BUDGET = budget
+
+        print("✅ Batch sizing test passed")
+        return True
+
+    except Exception as e:
+        print(f"❌ Batch sizing test failed: {e}")
+        return False
+
+
 def test_database_operations():
     """Test database CRUD operations."""
     print("\n🧪 Testing database operations...")
@@ -76,6 +171,24 @@ def test_database_operations():
             how="truncate",
         )
 
+        # Unsized Arrow streams are rejected before anything is written
+        class ArrowStream:
+            def __arrow_c_stream__(self, requested_schema=None):
+                raise AssertionError("Stream shouldn't be consumed")
+
+        try:
+            operate_on_table(
+                conn=conn,
+                schema_name=test_schema,
+                table_name="test_persons",
+                action="write",
+                object_data=ArrowStream(),
+                how="append",
+            )
+            raise AssertionError("Unsized stream should be rejected")
+        except ValueError:
+            pass
+
         # Test ping operation (table should exist now)
         exists_after = operate_on_table(
             conn=conn, schema_name=test_schema, table_name="test_persons", action="ping"
@@ -106,6 +219,374 @@ def test_database_operations():
         return False
 
 
+def test_table_info():
+    """Test table metadata lookups."""
+    print("\n🧪 Testing table info...")
+
+    try:
+        conn = connect_to_duckdb(DatabaseConfig.for_testing())
+        test_schema = "test"
+
+        missing = get_table_info(conn, test_schema, "test_info")
+        assert not missing["exists"], "Missing table should not exist"
+        assert missing["row_count"] == 0, "Missing table should have no rows"
+
+        persons = generate_multiple_persons(4, seed=321)
+        df = pd.DataFrame([person.to_dict() for person in persons])
+        operate_on_table(
+            conn=conn,
+            schema_name=test_schema,
+            table_name="test_info",
+            action="write",
+            object_data=df,
+            how="truncate",
+        )
+
+        info = get_table_info(conn, test_schema, "test_info")
+        assert info["exists"], "Table should exist after write"
+        assert info["row_count"] == 4, "Should have 4 records"
+        assert len(info["columns"]) == len(df.columns), "Should list every column"
+
+        # Cached counts must be invalidated by writes
+        assert count_rows(conn, test_schema, "test_info") == 4, "Should count 4"
+        operate_on_table(
+            conn=conn,
+            schema_name=test_schema,
+            table_name="test_info",
+            action="write",
+            object_data=df,
+        )
+        assert count_rows(conn, test_schema, "test_info") == 8, "Should count 8"
+        assert (
+            count_rows(conn, test_schema, "test_info", cache=False) == 8
+        ), "Cached count should match the table"
+        assert count_rows(conn, test_schema, "missing") == 0, "Missing has 0 rows"
+        info = get_table_info(conn, test_schema, "test_info")
+        assert info["row_count"] == 8, "Cached info should see the append"
+
+        operate_on_table(
+            conn=conn,
+            schema_name=test_schema,
+            table_name="test_info",
+            action="clear",
+        )
+        info = get_table_info(conn, test_schema, "test_info")
+        assert info["exists"] and info["row_count"] == 0, "Should be empty after clear"
+
+        # Cleanup
+        conn.execute(f"DROP SCHEMA IF EXISTS {test_schema} CASCADE")
+        conn.close()
+
+        # A failed probe is an error, not a missing table
+        try:
+            get_table_info(conn, test_schema, "test_probe")
+            raise AssertionError("Probe on a closed connection should raise")
+        except duckdb.Error:
+            pass
+
+        print("✅ Table info test passed")
+        return True
+
+    except Exception as e:
+        print(f"❌ Table info test failed: {e}")
+        return False
+
+
+def test_append_row_counts():
+    """Test that appends to an existing table look it up only once."""
+    print("\n🧪 Testing append row counts...")
+
+    table_exists = loader._table_exists
+    try:
+        conn = connect_to_duckdb(DatabaseConfig.for_testing())
+        test_schema = "test"
+
+        # A table left by an earlier run, so its count isn't cached yet
+        conn.execute(f"CREATE SCHEMA IF NOT EXISTS {test_schema}")
+        conn.execute(f"CREATE TABLE {test_schema}.test_appends AS SELECT 1 AS id")
+
+        lookups = []
+
+        def counting_table_exists(*args):
+            lookups.append(args)
+            return table_exists(*args)
+
+        loader._table_exists = counting_table_exists
+        for _ in range(3):
+            operate_on_table(
+                conn=conn,
+                schema_name=test_schema,
+                table_name="test_appends",
+                action="write",
+                object_data=[{"id": 2}, {"id": 3}],
+            )
+        assert len(lookups) == 1, f"Expected 1 catalog lookup, got {len(lookups)}"
+        assert count_rows(conn, test_schema, "test_appends") == 7, "Should count 7"
+        assert (
+            count_rows(conn, test_schema, "test_appends", cache=False) == 7
+        ), "Cached count should match the table"
+
+        # Cleanup
+        conn.execute(f"DROP SCHEMA IF EXISTS {test_schema} CASCADE")
+        conn.close()
+
+        print("✅ Append row counts test passed")
+        return True
+
+    except Exception as e:
+        print(f"❌ Append row counts test failed: {e}")
+        return False
+    finally:
+        loader._table_exists = table_exists
+
+
+def test_shared_connection():
+    """Test that cursors share one database handle."""
+    print("\n🧪 Testing shared connection...")
+
+    try:
+        config = DatabaseConfig.for_testing()
+        first = get_connection(config)
+        second = get_connection(config)
+
+        first.execute("CREATE OR REPLACE TABLE test.shared AS SELECT 42 AS answer")
+        result = second.execute("SELECT answer FROM test.shared").fetchone()
+        assert result == (42,), "Cursors should see each other's writes"
+
+        # Closing a cursor leaves the shared handle usable
+        first.close()
+        third = get_connection(config)
+        assert third.execute("SELECT COUNT(*) FROM test.shared").fetchone() == (1,)
+
+        third.execute("DROP SCHEMA IF EXISTS test CASCADE")
+        second.close()
+        third.close()
+        close_connections()
+
+        print("✅ Shared connection test passed")
+        return True
+
+    except Exception as e:
+        print(f"❌ Shared connection test failed: {e}")
+        return False
+
+
+def test_prefetch():
+    """Test background batch production."""
+    print("\n🧪 Testing prefetch...")
+
+    try:
+        # Batches arrive in order
+        assert list(cli.prefetch(range(5), depth=2)) == [0, 1, 2, 3, 4]
+
+        # A producer error is re-raised in the consumer
+        def failing():
+            yield 1
+            raise RuntimeError("producer broke")
+
+        received = []
+        try:
+            for batch in cli.prefetch(failing()):
+                received.append(batch)
+            raise AssertionError("Producer error should reach the consumer")
+        except RuntimeError as e:
+            assert str(e) == "producer broke", f"Unexpected error: {e}"
+        assert received == [1], "Batches before the error should be delivered"
+
+        # A consumer that stops early shuts the producer down
+        produced = []
+
+        def endless():
+            while True:
+                produced.append(len(produced))
+                yield produced[-1]
+
+        batches = cli.prefetch(endless(), depth=2)
+        assert next(batches) == 0
+        batches.close()
+        producers = [t for t in threading.enumerate() if t.name == "earth-producer"]
+        assert not producers, "Producer thread should stop with the consumer"
+        stopped_at = len(produced)
+        time.sleep(0.2)
+        assert len(produced) == stopped_at, "Producer kept running after close"
+
+        print("✅ Prefetch test passed")
+        return True
+
+    except Exception as e:
+        print(f"❌ Prefetch test failed: {e}")
+        return False
+
+
+def test_cli_arguments():
+    """Test command-line argument validation."""
+    print("\n🧪 Testing CLI arguments...")
+
+    try:
+        parser = cli.build_parser()
+        args = parser.parse_args(["generate", "5", "--batch-size", "2"])
+        assert args.count == 5 and args.batch_size == 2
+
+        args = parser.parse_args(["generate", "--resume"])
+        assert args.resume and args.count is None
+
+        # Non-positive or non-numeric values exit with usage, status 2, and a
+        # run is either a new count or a resume
+        for argv in (
+            ["generate", "0"],
+            ["generate", "5", "--batch-size", "-1"],
+            ["generate"],
+            ["generate", "5", "--resume"],
+        ):
+            try:
+                parser.parse_args(argv)
+                raise AssertionError(f"Should reject {argv}")
+            except SystemExit as e:
+                assert e.code == 2, f"Expected usage error for {argv}"
+
+        print("✅ CLI arguments test passed")
+        return True
+
+    except Exception as e:
+        print(f"❌ CLI arguments test failed: {e}")
+        return False
+
+
+def test_generation_ledger():
+    """Test interrupted-run bookkeeping."""
+    print("\n🧪 Testing generation ledger...")
+
+    answer = cli.ask
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "persons.ledger.jsonl"
+            ledger = cli.GenerationLedger(path)
+            assert ledger.load() is None, "No ledger means no pending run"
+
+            # Two batches land, then the run is interrupted
+            ledger.start(10, "truncate", seed=42, batch_size=4)
+            ledger.record(4)
+            ledger.record(4)
+            pending = cli.GenerationLedger(path).load()
+            assert pending == {
+                "target": 10,
+                "how": "truncate",
+                "seed": 42,
+                "batch_size": 4,
+                "batches": 2,
+                "written": 8,
+            }, f"Unexpected ledger contents: {pending}"
+
+            earth = cli.EarthCLI()
+            earth.ledger = ledger
+            cli.ask = lambda prompt: "y"
+            assert earth.check_interrupted_run() == pending, "Should offer to resume"
+
+            # A new run needs --replace before it discards the ledger
+            try:
+                earth.check_discard_interrupted_run(replace=False)
+                raise AssertionError("Should refuse to discard the ledger")
+            except SystemExit:
+                pass
+            earth.check_discard_interrupted_run(replace=True)
+
+            # A torn final line from a crash mid-write is ignored
+            ledger.start(10, "append", seed=42, batch_size=4)
+            ledger.record(4)
+            with path.open("a") as f:
+                f.write('{"rows": 4')
+            pending = ledger.load()
+            assert pending["batches"] == 1, "Partial line shouldn't count"
+            assert pending["written"] == 4, "Partial line shouldn't count"
+
+            # A corrupt header, or one without a seed, leaves nothing to resume
+            path.write_text("not json\n")
+            assert ledger.load() is None, "Corrupt header means no pending run"
+            path.write_text('{"target": 10, "how": "append"}\n')
+            assert ledger.load() is None, "Run without a seed can't be replayed"
+
+            # A run that stored every row but didn't remove its ledger is done
+            ledger.start(4, "append", seed=42, batch_size=4)
+            ledger.record(4)
+            assert earth.pending_run() is None, "Finished run isn't pending"
+            assert not path.exists(), "Finished run's ledger should be removed"
+
+            # Declining to resume discards the ledger
+            ledger.start(10, "append", seed=42, batch_size=4)
+            ledger.record(4)
+            cli.ask = lambda prompt: "n"
+            assert earth.check_interrupted_run() is None
+            assert not path.exists(), "Declined run's ledger should be removed"
+
+        print("✅ Generation ledger test passed")
+        return True
+
+    except Exception as e:
+        print(f"❌ Generation ledger test failed: {e}")
+        return False
+    finally:
+        cli.ask = answer
+
+
+def test_resume_interrupted_run():
+    """Test that a resumed run stores the same records as an uninterrupted one."""
+    print("\n🧪 Testing interrupted run resume...")
+
+    write = cli.operate_on_table
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            earth = cli.EarthCLI()
+            earth.db_config = DatabaseConfig.for_testing()
+            earth.schema_name = "test"
+            earth.ledger = cli.GenerationLedger(Path(tmp) / "persons.ledger.jsonl")
+            earth.initialize_database()
+
+            earth.table_name = "uninterrupted"
+            earth.generate_and_store_data(25, "truncate", batch_size=10, seed=7)
+
+            # The same run, stopped after its first batch was stored
+            writes = []
+
+            def crashing_write(**kwargs):
+                writes.append(kwargs)
+                if len(writes) > 1:
+                    raise RuntimeError("simulated crash")
+                return write(**kwargs)
+
+            earth.table_name = "resumed"
+            cli.operate_on_table = crashing_write
+            try:
+                earth.generate_and_store_data(25, "truncate", batch_size=10, seed=7)
+                raise AssertionError("Run should have been interrupted")
+            except SystemExit:
+                pass
+            finally:
+                cli.operate_on_table = write
+
+            pending = earth.pending_run()
+            assert pending["batches"] == 1, "One batch should have been stored"
+            earth.resume_interrupted_run(pending)
+            assert earth.pending_run() is None, "Finished run should clear its ledger"
+
+            # person_id and created_at are never seeded
+            query = "SELECT * EXCLUDE (person_id, created_at) FROM test.{}"
+            expected = earth.conn.execute(query.format("uninterrupted")).fetchall()
+            resumed = earth.conn.execute(query.format("resumed")).fetchall()
+            assert len(resumed) == 25, f"Expected 25 records, got {len(resumed)}"
+            assert resumed == expected, "Resumed run should store the same records"
+
+            # Cleanup
+            earth.conn.execute("DROP SCHEMA IF EXISTS test CASCADE")
+            earth.close()
+
+        print("✅ Interrupted run resume test passed")
+        return True
+
+    except Exception as e:
+        print(f"❌ Interrupted run resume test failed: {e}")
+        return False
+
+
 def test_data_quality():
     """Test the quality and realism of generated data."""
     print("\n🧪 Testing data quality...")
@@ -158,7 +639,16 @@ def main():
 
     tests = [
         test_person_generation,
+        test_batch_reproducibility,
+        test_choose_batch_size,
         test_database_operations,
+        test_table_info,
+        test_append_row_counts,
+        test_shared_connection,
+        test_prefetch,
+        test_cli_arguments,
+        test_generation_ledger,
+        test_resume_interrupted_run,
         test_data_quality,
     ]
 